@@ -7,7 +7,8 @@ Purpose
   server-side (no JavaScript required on the front end).
 
 Design goals
-- Minimal dependencies (Flask only; HTTP uses Python stdlib `urllib`).
+- Minimal dependencies (Flask only; HTTP uses Python stdlib `http.client`
+  with a small keep-alive connection pool, `urllib` for URL handling).
 - Two top-level folders: `Front-end/` for display and `Back-end/` for logic.
 - Server-rendered filters and results to satisfy “only HTML/CSS front”.
 - Robust error handling and clear, exhaustive documentation of variables and
@@ -31,27 +32,98 @@ Copyright
 
 from __future__ import annotations
 
+import functools
+import gzip
+import http.client
+import io
 import json
+import logging
 import os
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from dataclasses import dataclass, field, fields as dataclass_fields
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
-from flask import Flask, request, render_template, jsonify
+from flask import Flask, g, request, render_template, jsonify, url_for
 from flask import Response
 # Response: utile pour renvoyer des fichiers (CSV/ICS) avec bon mimetype
+from flask.json.provider import DefaultJSONProvider
 
 # Standard library HTTP client utilities
-from urllib.parse import urlencode, urljoin, urlparse
+from urllib.parse import quote_plus, urlencode, urljoin, urlparse, urlsplit
 # Remarque: ces utilitaires sont utilisés dans la construction d'URL ODS,
 # la normalisation des liens de résultats, et l'encodage de query strings.
-from urllib.request import Request, urlopen
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 from urllib.error import HTTPError, URLError
 import ssl
 try:
     import certifi  # type: ignore
 except Exception:  # certifi optional; installed via requirements
     certifi = None  # type: ignore
+try:
+    import orjson  # type: ignore
+except Exception:  # orjson optional; faster JSON parsing when installed
+    orjson = None  # type: ignore
+
+
+_LOG = logging.getLogger(__name__)
+# Journal applicatif (avertissements de configuration portail, ex: colonnes absentes).
+
+
+# --------------------------------------------------------------------------------------
+# In-memory cache primitive
+# --------------------------------------------------------------------------------------
+
+class _TTLCache:
+    """Bounded LRU mapping with a per-entry time-to-live, shared across threads.
+
+    Parameters
+    - maxsize: Maximum number of entries; the least recently used is evicted first.
+    - ttl: Lifetime of an entry in seconds; expired entries read as missing.
+
+    Exceptions
+    - None. All operations are guarded by an `RLock` (Flask's threaded server).
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def discard_where(self, predicate: Any) -> int:
+        # Supprime les entrées dont la clé vérifie `predicate`; renvoie leur nombre.
+        with self._lock:
+            stale = [key for key in self._data if predicate(key)]
+            for key in stale:
+                del self._data[key]
+            return len(stale)
 
 
 # --------------------------------------------------------------------------------------
@@ -63,6 +135,13 @@ except Exception:  # certifi optional; installed via requirements
 ODS_BASE: str = os.environ.get("ODS_BASE", "https://boamp-datadila.opendatasoft.com")
 # Exemple d'usage: changer pour un portail ODS interne -> exportez ODS_BASE.
 
+# Derived once from ODS_BASE: `_normalize_record_url` runs for every mapped record
+# and would otherwise re-parse the same base URL each time.
+_BASE_NO_SLASH: str = ODS_BASE.rstrip("/")
+_BASE_HOST: str = urlparse(_BASE_NO_SLASH).hostname or ""
+_IS_BOAMP_PORTAL: bool = _BASE_HOST.endswith("boamp.fr")
+# Remarque: sur le portail par défaut (opendatasoft.com) ce drapeau vaut False.
+
 # Dataset slug. "boamp" is the standard dataset for BOAMP notices on the portal.
 DATASET_ID: str = os.environ.get("DATASET_ID", "boamp")
 # Exemple d'usage: certains portails hébergent un dataset "boamp_test".
@@ -81,11 +160,42 @@ REQUEST_TIMEOUT_SECONDS: int = int(os.environ.get("REQUEST_TIMEOUT_SECONDS", "30
 # Augmentez si réseau lent/filtré; baissez pour éviter de bloquer l'UI.
 RESULTS_CACHE_TTL_SECONDS: int = int(os.environ.get("RESULTS_CACHE_TTL_SECONDS", "60"))
 # Adapter selon le volume et la fréquence de consultation.
-_RESULTS_CACHE: Dict[str, Dict[str, Any]] = {}
-# Structure: { key: { value: (records,total,debug_url,fields), ts: float } }
+RESULTS_CACHE_MAXSIZE: int = int(os.environ.get("RESULTS_CACHE_MAXSIZE", "512"))
+# Nombre max d'entrées par cache (résultats, HTML); les moins récemment lues sont évincées.
+_RESULTS_CACHE = _TTLCache(maxsize=RESULTS_CACHE_MAXSIZE, ttl=RESULTS_CACHE_TTL_SECONDS)
+# Structure: { (ODS_BASE, DATASET_ID, q, cpv_prefix, dept_codes, buyer, date_from, date_to,
+#               use_training, nature_in, fields, page, page_size, sort): (records,total,debug_url,fields) }
+VIEW_CACHE_TTL_SECONDS: int = int(os.environ.get("VIEW_CACHE_TTL_SECONDS", str(RESULTS_CACHE_TTL_SECONDS)))
+# Durée de vie du HTML rendu de /search (0 pour désactiver). Évite appel ODS + rendu Jinja.
+_VIEW_CACHE = _TTLCache(maxsize=RESULTS_CACHE_MAXSIZE, ttl=VIEW_CACHE_TTL_SECONDS)
+# Structure: { "path?query triée": html }
 AUTO_FALLBACK_INSECURE_SSL: bool = os.environ.get("AUTO_FALLBACK_INSECURE_SSL", "1").lower() in {"1", "true", "yes", "on"}
 # Si True, retente 1 fois en SSL non vérifié lorsqu'un CERTIFICATE_VERIFY_FAILED survient.
 # Utile pour les environnements d'entreprise; à désactiver en production stricte.
+ALLOW_INSECURE_SSL: bool = os.environ.get("ALLOW_INSECURE_SSL", "0").lower() in {"1", "true", "yes", "on"}
+# Si True, aucune vérification de certificat (dernier recours, jamais en production).
+SSL_CA_FILE: Optional[str] = (
+    os.environ.get("SSL_CERT_FILE") or os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+)
+SSL_CA_PATH: Optional[str] = os.environ.get("SSL_CERT_DIR")
+# Bundle/dossier CA alternatif (variables usuelles); sinon certifi, sinon magasin système.
+_LOCAL_CA_GUESS: str = os.path.join(os.path.dirname(__file__), "local_ca.pem")
+LOCAL_CA_FILE: Optional[str] = os.environ.get("LOCAL_CA_FILE") or (
+    _LOCAL_CA_GUESS if os.path.exists(_LOCAL_CA_GUESS) else None
+)
+# CA d'entreprise ajouté en plus du bundle (ex: Back-end/local_ca.pem déposé par les lanceurs).
+_PROXIES: Dict[str, str] = getproxies()
+# Proxys (env HTTP(S)_PROXY ou config système) lus une seule fois au démarrage.
+HTTP_POOL_MAXSIZE: int = int(os.environ.get("HTTP_POOL_MAXSIZE", "16"))
+# Nombre max de connexions keep-alive inactives conservées par hôte (au-delà: fermées).
+HTTP_RETRY_TOTAL: int = int(os.environ.get("HTTP_RETRY_TOTAL", "2"))
+HTTP_RETRY_BACKOFF_SECONDS: float = float(os.environ.get("HTTP_RETRY_BACKOFF_SECONDS", "0.3"))
+# Nouvelles tentatives sur 502/503/504 (attente: backoff * 2^tentative).
+PARALLEL_FALLBACK: bool = os.environ.get("PARALLEL_FALLBACK", "0").lower() in {"1", "true", "yes", "on"}
+# Si True, lance Records v1 en parallèle d'Explore (portails où Explore renvoie souvent 4xx).
+# Coût: une requête v1 superflue lorsque Explore répond correctement.
+WARMUP_ON_START: bool = os.environ.get("WARMUP_ON_START", "1").lower() in {"1", "true", "yes", "on"}
+# Si True, précharge le schéma (et une connexion TLS) en tâche de fond au démarrage.
 
 
 # Curated list of Île-de-France departments for quick filtering in the UI.
@@ -100,6 +210,14 @@ IDF_DEPARTEMENTS: List[Dict[str, str]] = [
     {"code": "95", "name": "95 – Val d'Oise"},
 ]
 
+# Every French department code accepted by the department filter: metropolitan
+# 01-95 (Corsica as 2A/2B, no "20") plus overseas departments and collectivities.
+_VALID_DEPTS: FrozenSet[str] = frozenset(
+    [f"{n:02d}" for n in range(1, 96) if n != 20]
+    + ["2A", "2B", "971", "972", "973", "974", "975", "976", "977", "978", "986", "987", "988"]
+)
+# Remarque: un code hors de cette liste est ignoré (jamais injecté dans la clause WHERE).
+
 
 # Curated keyword buckets to simplify text search composition for users.
 KEYWORD_BUCKETS: Dict[str, List[str]] = {
@@ -134,6 +252,10 @@ KEYWORD_BUCKETS: Dict[str, List[str]] = {
         "scrum",
     ],
 }
+# OR-expression of each bucket, joined once at import (empty terms dropped).
+_BUCKET_OR_EXPR: Dict[str, str] = {
+    name: " OR ".join(t for t in terms if str(t).strip()) for name, terms in KEYWORD_BUCKETS.items()
+}
 
 
 # Training perimeter per user guidance
@@ -147,6 +269,8 @@ TRAINING_TERMS: List[str] = [
     '"formation continue"',
     '"actions de formation"',
 ]
+# Expression plein texte formation, jointe une fois (utilisée par `_compose_keywords`).
+_TRAINING_OR: str = " OR ".join(TRAINING_TERMS)
 
 TRAINING_CPV_WHITELIST: List[str] = [
     # Curated list from user for formation domain
@@ -160,6 +284,28 @@ TRAINING_CPV_WHITELIST: List[str] = [
     "79952000",  # Organisation de séminaires / conférences
 ]
 
+# Explore WHERE clause for the training whitelist, prebuilt once; `{cpv}` is the
+# resolved CPV column name. Codes are digits only, so no quote escaping is needed.
+_TRAINING_CPV_LIKE_CLAUSE: str = (
+    "(" + " OR ".join(f"string({{cpv}}) LIKE '%{c}%'" for c in TRAINING_CPV_WHITELIST) + ")"
+)
+
+
+_TRAINING_CPV_TUPLE: Tuple[str, ...] = tuple(TRAINING_CPV_WHITELIST)
+
+
+@functools.lru_cache(maxsize=8)
+def _training_cpv_where(cpv_field: str) -> str:
+    # Clause WHERE formation finalisée pour une colonne CPV (stable par process).
+    return _TRAINING_CPV_LIKE_CLAUSE.format(cpv=cpv_field)
+
+
+@functools.lru_cache(maxsize=8)
+def _training_cpv_refines(cpv_field: str) -> Tuple[Tuple[str, str], ...]:
+    # Paramètres v1 `refine.<cpv>=<code>` de la liste blanche formation, prêts à étendre.
+    return tuple((f"refine.{cpv_field}", code) for code in TRAINING_CPV_WHITELIST)
+
+
 # Human-friendly catalog of CPV codes (subset focused on formation)
 CPV_CATALOG: List[Dict[str, str]] = [
     {"code": "80500000", "domaine": "Formation professionnelle", "description": "Services de formation"},
@@ -293,10 +439,13 @@ FIELD_CANDIDATES: Dict[str, List[str]] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResolvedFields:
     """Represents resolved dataset column names.
 
+    Instances are immutable and hashable (slots: fast attribute access, no
+    `__dict__`); derive variants with `dataclasses.replace`.
+
     Attributes
     - date: Column name for publication date.
     - title: Column name for title/intitulé.
@@ -307,6 +456,8 @@ class ResolvedFields:
     - description: Column name for description/object.
     - ref: Column name for reference or record id.
     - serviceCategory: Column for service category (for training use case).
+    - _present: Field names found in the schema, used to skip filters on
+      columns the portal does not have.
 
     Exceptions
     - None directly; if a field cannot be resolved, a safe fallback is used.
@@ -328,11 +479,244 @@ class ResolvedFields:
     procedure: str = "procedure"
     marketType: str = "type_marche"
     place: str = "lieu_execution"
+    # Field names actually present in the dataset schema (empty: schema unknown)
+    _present: FrozenSet[str] = field(default=frozenset(), repr=False)
+
+    def has(self, name: str) -> bool:
+        """Return True if `name` exists in the schema (always True when unknown)."""
+        return not self._present or name in self._present
 
 
-# Simple in-memory schema cache to avoid hitting the ODS catalog on each request.
-_SCHEMA_CACHE: Dict[str, Any] = {"value": None, "ts": 0.0}
+# Candidate column names as tuples (ordered by preference) and the fallback used
+# when none is present: the `ResolvedFields` default of the same semantic key.
+_FIELD_CANDIDATES_T: Dict[str, Tuple[str, ...]] = {key: tuple(names) for key, names in FIELD_CANDIDATES.items()}
+_FIELD_FALLBACKS: Dict[str, str] = {
+    f.name: f.default for f in dataclass_fields(ResolvedFields) if f.name in FIELD_CANDIDATES
+}
+
+# Record keys probed, in order, when the resolved title/URL column is empty for a
+# record (mapping loops in the views).
+_TITLE_KEYS_FALLBACK: Tuple[str, ...] = ("objet", "titre", "title")
+_URL_KEYS_FALLBACK: Tuple[str, ...] = ("permalink", "url_avis", "pageurl", "lien", "link", "url", "permalien")
+
+
+# In-memory schema cache to avoid hitting the ODS catalog on each request.
+# Schema and resolved fields are memoized together by `_get_schema_and_fields`.
 _SCHEMA_TTL_SECONDS: int = 600  # 10 minutes
+# TTL window of the schema currently held by `_get_schema_and_fields` (None: cold).
+_SCHEMA_LOADED_TOKEN: Dict[str, Optional[int]] = {"value": None}
+# Last resolved fields, used as a guess for speculative searches on a cold schema cache.
+_LAST_FIELDS: Dict[str, Optional[ResolvedFields]] = {"value": None}
+# Serializes cold schema loads: concurrent misses (warm-up thread, first requests)
+# wait for a single fetch instead of each hitting the portal.
+_SCHEMA_LOCK = threading.Lock()
+
+# Worker threads used to overlap independent ODS calls (network-bound).
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ods")
+
+
+# Keep-alive connection pool shared by all request threads.
+# Key: (scheme, host, port, insecure) -> idle connections ready for reuse.
+# A connection is checked out for one request/response exchange, then returned.
+_PoolKey = Tuple[str, str, int, bool]
+_POOL: Dict[_PoolKey, List[http.client.HTTPConnection]] = {}
+_POOL_LOCK = threading.Lock()
+_HTTP_HEADERS: Dict[str, str] = {
+    "User-Agent": "Minimal-BOAMP-Client/1.0",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+}
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+# Validators of previous JSON responses: url -> (ETag, Last-Modified, parsed payload).
+# Lets `_http_get_json` send a conditional GET and reuse the payload on 304.
+# Kept small on purpose: it targets the schema/catalog URL, and every entry pins a
+# full parsed payload (up to 100 records for an Explore page) beyond the results TTL.
+_ETAG_CACHE_MAXSIZE: int = 32
+_ETAG_CACHE = _TTLCache(maxsize=_ETAG_CACHE_MAXSIZE, ttl=24 * 3600)
+_MAX_REDIRECTS = 5
+# Errors meaning the server silently closed an idle keep-alive connection.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+def _build_ssl_context() -> ssl.SSLContext:
+    # Utilité: contexte TLS vérifié (certifi, CA d'entreprise...), construit une seule fois.
+    """Build the verifying SSL context shared by all HTTPS connections.
+
+    Returns
+    - `ssl.SSLContext` honoring `SSL_CERT_FILE`/`REQUESTS_CA_BUNDLE`/`CURL_CA_BUNDLE`,
+      `SSL_CERT_DIR`, `LOCAL_CA_FILE` (or `Back-end/local_ca.pem`) and certifi.
+
+    Exceptions
+    - None. Falls back to the system default context on CA loading errors.
+    """
+    try:
+        if SSL_CA_FILE or SSL_CA_PATH:
+            context = ssl.create_default_context(cafile=SSL_CA_FILE, capath=SSL_CA_PATH)
+        elif certifi is not None:
+            context = ssl.create_default_context(cafile=certifi.where())
+        else:
+            context = ssl.create_default_context()
+        # If a local/company CA certificate is provided, add it
+        if LOCAL_CA_FILE:
+            try:
+                context.load_verify_locations(cafile=LOCAL_CA_FILE)
+            except Exception:
+                pass
+    except Exception:
+        context = ssl.create_default_context()
+    return context
+
+
+# Built once at import (CA bundle read + parsed a single time). SSLContext is safe
+# to share between threads for concurrent handshakes.
+_SSL_CTX_DEFAULT: ssl.SSLContext = _build_ssl_context()
+_SSL_CTX_INSECURE: ssl.SSLContext = ssl._create_unverified_context()  # nosec - opt-in/fallback only
+
+
+def _ssl_context(insecure: bool) -> ssl.SSLContext:
+    # Sélectionne le contexte partagé: vérifié (défaut) ou non vérifié (opt-in/fallback).
+    return _SSL_CTX_INSECURE if insecure else _SSL_CTX_DEFAULT
+
+
+def _pool_checkout(key: _PoolKey, fresh: bool = False) -> Tuple[http.client.HTTPConnection, bool]:
+    # Sortie: (connexion, réutilisée?) — une connexion neuve n'ouvre le socket qu'à l'envoi.
+    if not fresh:
+        with _POOL_LOCK:
+            idle = _POOL.get(key)
+            if idle:
+                return idle.pop(), True
+    scheme, host, port, insecure = key
+    if scheme == "https":
+        conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+            host, port, timeout=REQUEST_TIMEOUT_SECONDS, context=_ssl_context(insecure)
+        )
+    else:
+        conn = http.client.HTTPConnection(host, port, timeout=REQUEST_TIMEOUT_SECONDS)
+    return conn, False
+
+
+def _pool_release(key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+    # Rend la connexion au pool, ou la ferme si le pool de cet hôte est plein.
+    with _POOL_LOCK:
+        idle = _POOL.setdefault(key, [])
+        if len(idle) < HTTP_POOL_MAXSIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _pool_exchange(key: _PoolKey, path: str, headers: Dict[str, str], fresh: bool = False) -> Tuple[int, str, Any, bytes]:
+    # Utilité: un échange GET complet sur une connexion du pool.
+    # Sortie: (status, reason, headers, body). Erreurs: OSError/HTTPException bruts.
+    conn, reused = _pool_checkout(key, fresh=fresh)
+    try:
+        conn.request("GET", path, headers=headers)
+        resp = conn.getresponse()
+        body = resp.read()
+    except Exception as e:
+        conn.close()
+        if reused and isinstance(e, _STALE_CONNECTION_ERRORS):
+            # Idle connection closed by the server: retry once on a new socket
+            return _pool_exchange(key, path, headers, fresh=True)
+        raise
+    if resp.will_close:
+        conn.close()
+    else:
+        _pool_release(key, conn)
+    return resp.status, resp.reason, resp.headers, body
+
+
+def _decode_body(resp_headers: Any, body: bytes) -> bytes:
+    # Décompresse un corps gzip (on annonce `Accept-Encoding: gzip`); sinon inchangé.
+    if body and (resp_headers.get("Content-Encoding") or "").lower() == "gzip":
+        return gzip.decompress(body)
+    return body
+
+
+@functools.lru_cache(maxsize=64)
+def _use_proxy(scheme: str, host: str) -> bool:
+    # Décision proxy mémorisée par hôte: `proxy_bypass` relit le registre (Windows)
+    # ou SystemConfiguration (macOS) à chaque appel.
+    return bool(_PROXIES.get(scheme)) and not proxy_bypass(host)
+
+
+def _urlopen_get(url: str, headers: Dict[str, str], insecure: bool) -> Tuple[int, Any, bytes]:
+    # Chemin sans pool (proxy configuré, schéma inhabituel): urllib gère proxy et redirections.
+    req = Request(url, headers={**headers, "Connection": "close"})
+    try:
+        with urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS, context=_ssl_context(insecure)) as resp:
+            return resp.status, resp.headers, _decode_body(resp.headers, resp.read())
+    except HTTPError as he:
+        if he.code == 304:  # urllib reports "Not Modified" as an error
+            return 304, he.headers, b""
+        raise
+
+
+def _http_get(url: str, insecure: bool, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any, bytes]:
+    # Utilité: GET brut via le pool keep-alive (retries 5xx, redirections).
+    # Sortie: (status, headers, body). Erreurs: HTTPError (>= 400), URLError (réseau/TLS).
+    """Perform an HTTP GET over a pooled keep-alive connection.
+
+    Parameters
+    - url: Absolute URL to fetch.
+    - insecure: If True, use connections that skip TLS certificate verification.
+    - headers: Request headers (defaults to `_HTTP_HEADERS`).
+
+    Returns
+    - (status, headers, body) for a successful (< 400) response, including
+      304 Not Modified (empty body) for conditional requests. Gzip-encoded
+      bodies are returned decompressed.
+
+    Exceptions
+    - HTTPError: Final response status is 4xx/5xx (after retries on 502/503/504).
+    - URLError: DNS, connection, timeout or TLS failure (same contract as `urlopen`).
+
+    Likely error causes
+    - Corporate proxy/CA not configured; portal outage or rate limiting.
+    """
+    hdrs = headers or _HTTP_HEADERS
+    try:
+        for _hop in range(_MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            scheme = parts.scheme.lower()
+            host = parts.hostname or ""
+            if scheme not in ("http", "https") or (_PROXIES and _use_proxy(scheme, host)):
+                return _urlopen_get(url, hdrs, insecure)
+            key: _PoolKey = (scheme, host, parts.port or (443 if scheme == "https" else 80), insecure)
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            for attempt in range(HTTP_RETRY_TOTAL + 1):
+                status, reason, resp_headers, body = _pool_exchange(key, path, hdrs)
+                if status not in _RETRY_STATUSES or attempt >= HTTP_RETRY_TOTAL:
+                    break
+                time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (2 ** attempt))
+            location = resp_headers.get("Location")
+            if status in _REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+            body = _decode_body(resp_headers, body)
+            if status >= 400:
+                raise HTTPError(url, status, reason, resp_headers, io.BytesIO(body))
+            return status, resp_headers, body
+        raise HTTPError(url, status, "Too many redirects", resp_headers, io.BytesIO(body))
+    except URLError:
+        raise
+    except (OSError, http.client.HTTPException) as e:
+        # Mirror urlopen: low-level socket/TLS/protocol errors surface as URLError
+        raise URLError(e) from e
+
+
+def _json_loads(data: bytes) -> Any:
+    # Utilité: parser un corps JSON brut (orjson si installé, sinon stdlib `json`).
+    # Erreurs: json.JSONDecodeError (orjson.JSONDecodeError en est une sous-classe).
+    if orjson is not None:
+        if data.startswith(b"\xef\xbb\xbf"):
+            # orjson rejects a UTF-8 BOM; skip it without copying the body
+            return orjson.loads(memoryview(data)[3:])
+        return orjson.loads(data)
+    # json detects UTF-8 (with or without BOM) itself
+    return json.loads(data)
 
 
 def _http_get_json(url: str) -> Any:
@@ -342,6 +726,12 @@ def _http_get_json(url: str) -> Any:
     # Erreurs: URLError/HTTPError/JSONDecodeError; fallback SSL possible si activé.
     """Perform an HTTP GET and parse a JSON response.
 
+    Connections are kept alive and reused across calls (see `_http_get`), so
+    repeated schema/Explore/v1 round-trips to `ODS_BASE` skip the TCP + TLS
+    handshake. When a previous response carried `ETag`/`Last-Modified`, the
+    request is conditional and a 304 returns the previously parsed payload
+    (treat it as read-only: it is shared between callers).
+
     Parameters
     - url: Absolute URL to fetch.
 
@@ -350,63 +740,93 @@ def _http_get_json(url: str) -> Any:
 
     Exceptions
     - URLError/HTTPError: Network issue, DNS failure, TLS error, HTTP 4xx/5xx.
-    - json.JSONDecodeError: Response is not valid JSON.
+    - json.JSONDecodeError: Response is not valid JSON (also raised by orjson,
+      used for parsing when installed).
 
     Likely error causes
     - Wrong `ODS_BASE` or `DATASET_ID`.
     - Portal requires API key and `ODS_APIKEY` not provided.
     - Temporary outage or rate limiting by the portal.
     """
-    req = Request(
-        url,
-        headers={
-            "User-Agent": "Minimal-BOAMP-Client/1.0",
-            "Accept": "application/json",
-            "Connection": "close",
-        },
-    )
-    # Build an SSL context using certifi when available, unless insecure is allowed
-    allow_insecure = os.environ.get("ALLOW_INSECURE_SSL", "0").lower() in {"1", "true", "yes", "on"}
-    # Allow overriding CA bundle via common env vars
-    ca_file = os.environ.get("SSL_CERT_FILE") or os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
-    ca_path = os.environ.get("SSL_CERT_DIR")
-
-    local_ca_guess = os.path.join(os.path.dirname(__file__), "local_ca.pem")
-    local_ca_file = os.environ.get("LOCAL_CA_FILE") or (local_ca_guess if os.path.exists(local_ca_guess) else None)
-
-    if allow_insecure:
-        context = ssl._create_unverified_context()  # nosec - user-controlled opt-in
-    else:
-        try:
-            if ca_file or ca_path:
-                context = ssl.create_default_context(cafile=ca_file, capath=ca_path)
-            elif certifi is not None:
-                context = ssl.create_default_context(cafile=certifi.where())
-            else:
-                context = ssl.create_default_context()
-            # If a local/company CA certificate is provided, add it
-            if local_ca_file:
-                try:
-                    context.load_verify_locations(cafile=local_ca_file)
-                except Exception:
-                    pass
-        except Exception:
-            context = ssl.create_default_context()
+    headers = _HTTP_HEADERS
+    cached = _ETAG_CACHE.get(url)
+    if cached:
+        etag, last_modified, _payload = cached
+        headers = dict(_HTTP_HEADERS)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
     try:
-        with urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS, context=context) as resp:
-            data = resp.read()
-        return json.loads(data.decode("utf-8"))
-    except Exception as e:
+        status, resp_headers, data = _http_get(url, insecure=ALLOW_INSECURE_SSL, headers=headers)
+    except URLError as e:
         # Auto-fallback to insecure SSL once if verification fails
-        msg = str(e)
-        if (not allow_insecure) and AUTO_FALLBACK_INSECURE_SSL and (
-            "CERTIFICATE_VERIFY_FAILED" in repr(e) or "certificate verify failed" in msg.lower()
+        if (not ALLOW_INSECURE_SSL) and AUTO_FALLBACK_INSECURE_SSL and (
+            "CERTIFICATE_VERIFY_FAILED" in repr(e) or "certificate verify failed" in str(e).lower()
         ):
-            insecure_ctx = ssl._create_unverified_context()  # nosec - explicit fallback
-            with urlopen(req, timeout=REQUEST_TIMEOUT_SECONDS, context=insecure_ctx) as resp:
-                data = resp.read()
-            return json.loads(data.decode("utf-8"))
-        raise
+            status, resp_headers, data = _http_get(url, insecure=True, headers=headers)
+        else:
+            raise
+    if status == 304 and cached:
+        return cached[2]
+    payload = _json_loads(data)
+    del data  # release the raw body before the payload is retained by caches
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if etag or last_modified:
+        _ETAG_CACHE[url] = (etag, last_modified, payload)
+    return payload
+
+
+def _schema_token() -> int:
+    # Fenêtre TTL courante: le cache schéma est invalidé à chaque changement de fenêtre.
+    return int(time.time()) // _SCHEMA_TTL_SECONDS
+
+
+@functools.lru_cache(maxsize=4)
+def _get_schema_and_fields(force_token: int) -> Tuple[Dict[str, Any], ResolvedFields]:
+    # Utilité: schéma + champs résolus, mémorisés ensemble pour une fenêtre TTL.
+    # Entrée: `force_token` (voir `_schema_token`), sert uniquement de clé de cache.
+    # Erreurs: celles de `_http_get_json`; une erreur n'est jamais mise en cache.
+    base = ODS_BASE.rstrip("/")
+    url = f"{base}/api/v2/catalog/datasets/{DATASET_ID}"
+    if ODS_APIKEY:
+        url = f"{url}?{urlencode({'apikey': ODS_APIKEY})}"
+    schema = _http_get_json(url)
+    fields = resolve_fields(schema)
+    _SCHEMA_LOADED_TOKEN["value"] = force_token
+    return schema, fields
+
+
+def _schema_is_warm() -> bool:
+    # Vrai si `fetch_dataset_schema()` répondra depuis le cache (aucun appel réseau).
+    return _SCHEMA_LOADED_TOKEN["value"] == _schema_token()
+
+
+def schema_and_fields(force_refresh: bool = False) -> Tuple[Dict[str, Any], ResolvedFields]:
+    # Utilité: accès groupé schéma + `ResolvedFields` (chemin chaud des recherches).
+    """Return the cached dataset schema together with its resolved fields.
+
+    Parameters
+    - force_refresh: If True, drop the cached schema and re-fetch it.
+
+    Returns
+    - (schema, fields): schema as returned by `fetch_dataset_schema` and the
+      immutable `ResolvedFields` derived from it (safe to share across threads).
+
+    Exceptions
+    - Propagates network/HTTP/JSON errors from `_http_get_json`.
+    """
+    token = _schema_token()
+    if not force_refresh and _SCHEMA_LOADED_TOKEN["value"] == token:
+        # Chemin chaud: lecture directe du cache, sans verrou.
+        return _get_schema_and_fields(token)
+    with _SCHEMA_LOCK:
+        if force_refresh:
+            _get_schema_and_fields.cache_clear()
+            _SCHEMA_LOADED_TOKEN["value"] = None
+        # Un appelant concurrent a pu charger le schéma pendant l'attente du verrou.
+        return _get_schema_and_fields(token)
 
 
 def fetch_dataset_schema(force_refresh: bool = False) -> Dict[str, Any]:
@@ -428,19 +848,7 @@ def fetch_dataset_schema(force_refresh: bool = False) -> Dict[str, Any]:
     Likely error causes
     - Network issues, wrong portal base, missing dataset, missing/invalid API key.
     """
-    now = time.time()
-    cached = _SCHEMA_CACHE.get("value")
-    if not force_refresh and cached and (now - _SCHEMA_CACHE.get("ts", 0)) < _SCHEMA_TTL_SECONDS:
-        return cached  # type: ignore[return-value]
-
-    base = ODS_BASE.rstrip("/")
-    url = f"{base}/api/v2/catalog/datasets/{DATASET_ID}"
-    if ODS_APIKEY:
-        url = f"{url}?{urlencode({'apikey': ODS_APIKEY})}"
-    schema = _http_get_json(url)
-    _SCHEMA_CACHE["value"] = schema
-    _SCHEMA_CACHE["ts"] = now
-    return schema
+    return schema_and_fields(force_refresh=force_refresh)[0]
 
 
 def resolve_fields(schema: Dict[str, Any]) -> ResolvedFields:
@@ -463,36 +871,26 @@ def resolve_fields(schema: Dict[str, Any]) -> ResolvedFields:
     - Schema shape differs from the expected ODS catalog response. In practice,
       we stick to safe defaults if fields cannot be discovered.
     """
-    names: List[str] = []
+    names: FrozenSet[str] = frozenset()
     try:
-        names = [f.get("name", "") for f in (schema.get("dataset", {}).get("fields", []) or [])]
+        names = frozenset(f.get("name", "") for f in (schema.get("dataset", {}).get("fields", []) or []))
     except Exception:
-        names = []
-
-    def pick(candidates: Iterable[str], fallback: str) -> str:
-        for c in candidates:
-            if c in names:
-                return c
-        return fallback
-
-    return ResolvedFields(
-        date=pick(FIELD_CANDIDATES["date"], "record_timestamp"),
-        title=pick(FIELD_CANDIDATES["title"], "title"),
-        url=pick(FIELD_CANDIDATES["url"], "permalink"),
-        cpv=pick(FIELD_CANDIDATES["cpv"], "cpv"),
-        dept=pick(FIELD_CANDIDATES["dept"], "departement"),
-        buyer=pick(FIELD_CANDIDATES["buyer"], "acheteur"),
-        description=pick(FIELD_CANDIDATES["description"], "description"),
-        ref=pick(FIELD_CANDIDATES["ref"], "id"),
-        serviceCategory=pick(FIELD_CANDIDATES["serviceCategory"], "categorie_services"),
-        nature=pick(FIELD_CANDIDATES["nature"], "nature"),
-        deadline=pick(FIELD_CANDIDATES["deadline"], "date_limite_remise_offres"),
-        buyerAddress=pick(FIELD_CANDIDATES["buyerAddress"], "nom_et_adresse_officiels_de_l_organisme_acheteur"),
-        budget=pick(FIELD_CANDIDATES["budget"], "montant"),
-        procedure=pick(FIELD_CANDIDATES["procedure"], "procedure"),
-        marketType=pick(FIELD_CANDIDATES["marketType"], "type_marche"),
-        place=pick(FIELD_CANDIDATES["place"], "lieu_execution"),
-    )
+        names = frozenset()
+
+    def pick(key: str) -> str:
+        return next((c for c in _FIELD_CANDIDATES_T[key] if c in names), _FIELD_FALLBACKS[key])
+
+    return ResolvedFields(_present=names, **{key: pick(key) for key in _FIELD_CANDIDATES_T})
+
+
+# Doubles single quotes in one C-level pass (ODS WHERE string literal escaping).
+_QUOTE_TRANS = str.maketrans({"'": "''"})
+
+
+def _quote_literal(value: Any) -> str:
+    # Échappe une valeur pour un littéral '...' dans un WHERE ODS (vide -> "").
+    v = str(value)
+    return v.translate(_QUOTE_TRANS) if v else v
 
 
 def _safe_like_fragment(field: str, value: str) -> str:
@@ -512,59 +910,51 @@ def _safe_like_fragment(field: str, value: str) -> str:
     Likely error causes
     - None for the function. Upstream issues: field not present in dataset.
     """
-    v = str(value).replace("'", "''")
-    return f"string({field}) LIKE '%{v}%'"
+    return f"string({field}) LIKE '%{_quote_literal(value)}%'"
 
 
-def build_explore_url(
+@functools.lru_cache(maxsize=None)
+def _warn_missing_column(filter_desc: str) -> None:
+    # Un seul avertissement par filtre/colonne absente et par process (mémoïsé),
+    # quel que soit le nombre de requêtes distinctes qui le rencontrent.
+    _LOG.warning("Explore filter skipped, column absent from dataset %s: %s", DATASET_ID, filter_desc)
+
+
+@functools.lru_cache(maxsize=128)
+def build_explore_url_base(
     *,
     keywords: str,
     cpv_prefix: str,
-    dept_codes: List[str],
+    dept_codes: Tuple[str, ...],
     buyer: Optional[str],
     service_category_equals: Optional[str],
-    cpv_whitelist: Optional[List[str]],
-    nature_in: Optional[List[str]],
+    cpv_whitelist: Optional[Tuple[str, ...]],
+    nature_in: Optional[Tuple[str, ...]],
     sort: Optional[str],
     date_from: Optional[str],
     date_to: Optional[str],
-    page: int,
-    page_size: int,
     fields: ResolvedFields,
 ) -> str:
-    # Utilité: assembler les paramètres Explore v2.1 (q, where, tri, pagination).
-    # Sortie: URL prête à être appelée via `_http_get_json`.
-    # Attention: la validité des champs/WHERE dépend du schéma réel du dataset.
-    """Build an Explore v2.1 query URL.
-
-    Parameters
-    - keywords: Free text used in `q` parameter (can be empty).
-    - cpv_prefix: Optional CPV prefix; expands to a broad LIKE on `fields.cpv`.
-    - dept_codes: List of department codes to filter with `IN (...)`.
-    - buyer: Optional buyer name to filter via LIKE.
-    - service_category_equals: Optional exact match on service category field.
-    - cpv_whitelist: Optional list of CPV codes enforced via ORed LIKEs.
-    - date_from/date_to: Optional ISO dates (YYYY-MM-DD) bounds on `fields.date`.
-    - page/page_size: Pagination controls converted to `offset`/`limit`.
-    - fields: ResolvedFields indicating actual dataset column names.
-
-    Returns
-    - Absolute Explore v2.1 URL with encoded query parameters.
-
-    Exceptions
-    - None. String building only.
-
-    Likely error causes
-    - Using a field that does not exist in the dataset may produce 4xx from ODS.
-    """
+    # Utilité: partie stable de l'URL Explore (q, where, tri) — mémorisée, seule la
+    # pagination change d'une page à l'autre (voir `build_explore_url`).
+    # Entrées: mêmes filtres que `build_explore_url`, listes converties en tuples.
     params: List[Tuple[str, str]] = []
     if keywords and keywords.strip():
         params.append(("q", keywords.strip()))
 
     where: List[str] = []
 
+    # Filters on columns missing from the schema would only earn a 4xx from ODS
+    # (then a v1 fallback round-trip): skip them and warn once per missing column.
+    dropped: List[str] = []
+    cpv_ok = fields.has(fields.cpv or "cpv")
+
     # CPV whitelist: build (string(cpv) LIKE '%...%' OR ...)
-    if cpv_whitelist:
+    if cpv_whitelist and not cpv_ok:
+        dropped.append(f"cpv whitelist ({fields.cpv})")
+    elif cpv_whitelist == _TRAINING_CPV_TUPLE:
+        where.append(_training_cpv_where(fields.cpv or "cpv"))
+    elif cpv_whitelist:
         parts = [
             _safe_like_fragment(fields.cpv or "cpv", c)
             for c in cpv_whitelist
@@ -574,33 +964,44 @@ def build_explore_url(
             where.append("(" + " OR ".join(parts) + ")")
 
     # CPV prefix: loose match on cpv field
-    if cpv_prefix:
-        prefix = str(cpv_prefix).replace("'", "''")
+    if cpv_prefix and not cpv_ok:
+        dropped.append(f"cpv prefix ({fields.cpv})")
+    elif cpv_prefix:
+        prefix = _quote_literal(cpv_prefix)
         where.append(
             f"(string({fields.cpv or 'cpv'}) LIKE '{prefix}%' OR string({fields.cpv or 'cpv'}) LIKE '%{prefix}%')"
         )
 
     # Departments IN (...)
-    if dept_codes:
-        in_list = ",".join([f"'{c}'" for c in dept_codes])
+    if dept_codes and not fields.has(fields.dept or "departement"):
+        dropped.append(f"departments ({fields.dept})")
+    elif dept_codes:
+        in_list = ",".join(f"'{c}'" for c in dept_codes)
         where.append(f"({fields.dept or 'departement'} IN ({in_list}))")
 
     # Buyer LIKE '%...%'
-    if buyer and buyer.strip():
+    if buyer and buyer.strip() and not fields.has(fields.buyer or "acheteur"):
+        dropped.append(f"buyer ({fields.buyer})")
+    elif buyer and buyer.strip():
         where.append(_safe_like_fragment(fields.buyer or "acheteur", buyer))
 
     # Service category equality (for training use case)
-    if service_category_equals not in (None, ""):
-        cat_val = str(service_category_equals).replace("'", "''")
+    has_category = service_category_equals not in (None, "")
+    if has_category and not fields.has(fields.serviceCategory or "categorie_services"):
+        dropped.append(f"service category ({fields.serviceCategory})")
+    elif has_category:
+        cat_val = _quote_literal(service_category_equals)
         where.append(f"{fields.serviceCategory or 'categorie_services'} = '{cat_val}'")
 
     # Nature IN ('AppelOffre','Attribution') if provided
-    if nature_in:
-        values = [f"'{str(v).replace("'", "''")}'" for v in nature_in if str(v).strip()]
+    if nature_in and not fields.has(fields.nature or "nature"):
+        dropped.append(f"nature ({fields.nature})")
+    elif nature_in:
+        values = [f"'{_quote_literal(v)}'" for v in nature_in if str(v).strip()]
         if values:
             where.append(f"string({fields.nature or 'nature'}) IN ({','.join(values)})")
 
-    # Date range
+    # Date range (record_timestamp is an ODS system field, never listed in the schema)
     date_field = fields.date or "record_timestamp"
     if date_from:
         where.append(f"{date_field} >= '{date_from}'")
@@ -609,17 +1010,17 @@ def build_explore_url(
 
     if where:
         params.append(("where", " AND ".join(where)))
+    for filter_desc in dropped:
+        _warn_missing_column(filter_desc)
 
     # Order newest first
     # Sorting
-    if sort == "deadline" and (fields.deadline or ""):
+    if sort == "deadline" and (fields.deadline or "") and fields.has(fields.deadline):
         params.append(("order_by", f"-{fields.deadline}"))
     elif sort == "relevance" and (keywords and keywords.strip()):
         params.append(("order_by", "relevance"))
     else:
         params.append(("order_by", f"-{date_field}"))
-    params.append(("limit", str(page_size)))
-    params.append(("offset", str((page - 1) * page_size)))
 
     if ODS_APIKEY:
         params.append(("apikey", ODS_APIKEY))
@@ -629,39 +1030,85 @@ def build_explore_url(
     return f"{base}/api/explore/v2.1/catalog/datasets/{DATASET_ID}/records?{query}"
 
 
-def build_records_v1_url(
+def build_explore_url(
     *,
-    q: Optional[str],
+    keywords: str,
+    cpv_prefix: str,
     dept_codes: List[str],
     buyer: Optional[str],
-    cpv_whitelist: Optional[List[str]],
     service_category_equals: Optional[str],
+    cpv_whitelist: Optional[List[str]],
+    nature_in: Optional[List[str]],
+    sort: Optional[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
     page: int,
     page_size: int,
     fields: ResolvedFields,
 ) -> str:
-    # Utilité: fallback plus permissif (refine.*) quand Explore rejette WHERE.
-    # Limitations: pas de `order_by` avancé ni de WHERE complexes.
-    """Build a fallback Records v1 API URL with refine.* parameters.
+    # Utilité: assembler les paramètres Explore v2.1 (q, where, tri, pagination).
+    # Sortie: URL prête à être appelée via `_http_get_json`.
+    # Attention: la validité des champs/WHERE dépend du schéma réel du dataset.
+    """Build an Explore v2.1 query URL.
+
+    The filter part comes from the memoized `build_explore_url_base`; only
+    `limit`/`offset` are appended per call.
 
     Parameters
-    - q: Optional text search.
-    - dept_codes/buyer/cpv_whitelist/service_category_equals: Refinement filters.
-    - page/page_size: Pagination.
-    - fields: Resolved column names.
+    - keywords: Free text used in `q` parameter (can be empty).
+    - cpv_prefix: Optional CPV prefix; expands to a broad LIKE on `fields.cpv`.
+    - dept_codes: List of department codes to filter with `IN (...)`.
+    - buyer: Optional buyer name to filter via LIKE.
+    - service_category_equals: Optional exact match on service category field.
+    - cpv_whitelist: Optional list of CPV codes enforced via ORed LIKEs.
+    - date_from/date_to: Optional ISO dates (YYYY-MM-DD) bounds on `fields.date`.
+    - page/page_size: Pagination controls converted to `offset`/`limit`.
+    - fields: ResolvedFields indicating actual dataset column names.
 
     Returns
-    - Absolute Records v1 URL with encoded search/refine parameters.
+    - Absolute Explore v2.1 URL with encoded query parameters.
 
     Exceptions
     - None. String building only.
+
+    Likely error causes
+    - Using a field that does not exist in the dataset may produce 4xx from ODS.
     """
-    params: List[Tuple[str, str]] = [("dataset", DATASET_ID), ("rows", str(page_size)), ("start", str((page - 1) * page_size))]
+    base = build_explore_url_base(
+        keywords=keywords,
+        cpv_prefix=cpv_prefix,
+        dept_codes=tuple(dept_codes or ()),
+        buyer=buyer,
+        service_category_equals=service_category_equals,
+        cpv_whitelist=tuple(cpv_whitelist) if cpv_whitelist else None,
+        nature_in=tuple(nature_in) if nature_in else None,
+        sort=sort,
+        date_from=date_from,
+        date_to=date_to,
+        fields=fields,
+    )
+    return f"{base}&limit={page_size}&offset={(page - 1) * page_size}"
+
+
+@functools.lru_cache(maxsize=128)
+def build_records_v1_url_base(
+    *,
+    q: Optional[str],
+    dept_codes: Tuple[str, ...],
+    buyer: Optional[str],
+    cpv_whitelist: Optional[Tuple[str, ...]],
+    service_category_equals: Optional[str],
+    fields: ResolvedFields,
+) -> str:
+    # Utilité: partie stable de l'URL Records v1 (q, refine.*) — mémorisée.
+    params: List[Tuple[str, str]] = [("dataset", DATASET_ID)]
     if q:
         params.append(("q", q))
 
     # cpv whitelist: multiple refine.cpv=value
-    if cpv_whitelist:
+    if cpv_whitelist == _TRAINING_CPV_TUPLE:
+        params.extend(_training_cpv_refines(fields.cpv or "cpv"))
+    elif cpv_whitelist:
         for code in cpv_whitelist:
             params.append((f"refine.{fields.cpv or 'cpv'}", str(code)))
 
@@ -682,18 +1129,67 @@ def build_records_v1_url(
     return f"{base}/api/records/1.0/search/?{urlencode(params)}"
 
 
-def _cache_get(key: str) -> Optional[Tuple[List[Dict[str, Any]], Optional[int], str, ResolvedFields]]:
-    entry = _RESULTS_CACHE.get(key)
-    if not entry:
-        return None
-    if (time.time() - entry.get("ts", 0)) > RESULTS_CACHE_TTL_SECONDS:
-        _RESULTS_CACHE.pop(key, None)
-        return None
-    return entry.get("value")  # type: ignore[return-value]
+def build_records_v1_url(
+    *,
+    q: Optional[str],
+    dept_codes: List[str],
+    buyer: Optional[str],
+    cpv_whitelist: Optional[List[str]],
+    service_category_equals: Optional[str],
+    page: int,
+    page_size: int,
+    fields: ResolvedFields,
+) -> str:
+    # Utilité: fallback plus permissif (refine.*) quand Explore rejette WHERE.
+    # Limitations: pas de `order_by` avancé ni de WHERE complexes.
+    """Build a fallback Records v1 API URL with refine.* parameters.
+
+    The refine part comes from the memoized `build_records_v1_url_base`; only
+    `rows`/`start` are appended per call.
+
+    Parameters
+    - q: Optional text search.
+    - dept_codes/buyer/cpv_whitelist/service_category_equals: Refinement filters.
+    - page/page_size: Pagination.
+    - fields: Resolved column names.
+
+    Returns
+    - Absolute Records v1 URL with encoded search/refine parameters.
+
+    Exceptions
+    - None. String building only.
+    """
+    base = build_records_v1_url_base(
+        q=q,
+        dept_codes=tuple(dept_codes or ()),
+        buyer=buyer,
+        cpv_whitelist=tuple(cpv_whitelist) if cpv_whitelist else None,
+        service_category_equals=service_category_equals,
+        fields=fields,
+    )
+    return f"{base}&rows={page_size}&start={(page - 1) * page_size}"
+
+
+# Result cache keys are plain tuples of hashable values: no serialization or
+# digest on the hot path, tuple hashing is done natively by CPython.
+_CacheKey = Tuple[Any, ...]
+
+
+def _cache_get(key: _CacheKey) -> Optional[Tuple[List[Dict[str, Any]], Optional[int], str, ResolvedFields]]:
+    return _RESULTS_CACHE.get(key)
+
+
+def _cache_set(key: _CacheKey, value: Tuple[List[Dict[str, Any]], Optional[int], str, ResolvedFields]) -> None:
+    _RESULTS_CACHE[key] = value
 
 
-def _cache_set(key: str, value: Tuple[List[Dict[str, Any]], Optional[int], str, ResolvedFields]) -> None:
-    _RESULTS_CACHE[key] = {"value": value, "ts": time.time()}
+def _cache_invalidate(prefix: _CacheKey = ()) -> int:
+    # Utilité: purger les pages mises en cache dont la clé commence par `prefix`
+    # (tout vider avec le préfixe vide), p.ex. après un rafraîchissement du schéma.
+    # Sortie: nombre d'entrées supprimées.
+    n = len(prefix)
+    matches = (lambda key: key[:n] == prefix) if n else (lambda key: True)
+    return _RESULTS_CACHE.discard_where(matches)
 
 
 def _try_explore(
@@ -731,7 +1227,7 @@ def _try_explore(
         fields=fields,
     )
     data = _http_get_json(explore_url)
-    records = list(data.get("results") or [])
+    records = data.get("results") or []
     total = data.get("total_count")
     return records, (int(total) if isinstance(total, int) else total), explore_url, fields
 
@@ -760,11 +1256,119 @@ def _try_records_v1(
         fields=fields,
     )
     data = _http_get_json(v1_url)
-    records = list(data.get("records") or [])
+    records = data.get("records") or []
     total = data.get("nhits")
     return records, (int(total) if isinstance(total, int) else total), v1_url, fields
 
 
+def _fetch_page(
+    explore_kwargs: Dict[str, Any],
+    v1_kwargs: Dict[str, Any],
+    parallel_fallback: bool,
+) -> Tuple[List[Dict[str, Any]], Optional[int], str, ResolvedFields]:
+    # Utilité: stratégie Explore/v1 (sans cache) pour une page de résultats.
+    # `parallel_fallback`: lance v1 en même temps qu'Explore (voir PARALLEL_FALLBACK).
+    # Erreurs: propage la dernière erreur réseau/HTTP/JSON après fallback.
+    if PREFER_EXPLORE and parallel_fallback:
+        # Hedged request: v1 runs alongside Explore; Explore still wins when it succeeds
+        fut_explore = _EXECUTOR.submit(_try_explore, **explore_kwargs)
+        fut_v1 = _EXECUTOR.submit(_try_records_v1, **v1_kwargs)
+        try:
+            result = fut_explore.result()
+            fut_v1.cancel()
+            return result
+        except HTTPError as he:
+            if not (400 <= getattr(he, "code", 0) <= 499):
+                fut_v1.cancel()
+                raise
+            return fut_v1.result()
+        except (URLError, json.JSONDecodeError):
+            return fut_v1.result()
+
+    if PREFER_EXPLORE:
+        try:
+            return _try_explore(**explore_kwargs)
+        except HTTPError as he:
+            # Only fallback on client-side errors (400-499) where WHERE may be rejected
+            if 400 <= getattr(he, "code", 0) <= 499:
+                return _try_records_v1(**v1_kwargs)
+            raise
+        except (URLError, json.JSONDecodeError):
+            # Network/parse error -> try v1
+            return _try_records_v1(**v1_kwargs)
+    # Prefer v1 path
+    try:
+        return _try_records_v1(**v1_kwargs)
+    except (HTTPError, URLError, json.JSONDecodeError):
+        return _try_explore(**explore_kwargs)
+
+
+def _search_with_fields(
+    fields: ResolvedFields,
+    *,
+    q: str,
+    cpv_prefix: str,
+    dept_codes: Tuple[str, ...],
+    buyer: Optional[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
+    nature_in: Optional[Tuple[str, ...]],
+    use_training: bool,
+    page: int,
+    page_size: int,
+    sort: Optional[str] = None,
+    parallel_fallback: bool = False,
+) -> Tuple[List[Dict[str, Any]], Optional[int], str, ResolvedFields]:
+    # Utilité: cache de pages autour de `_fetch_page` pour des champs résolus.
+    # Entrées: `dept_codes`/`nature_in` déjà canonisés en tuples triés (voir `perform_search`).
+    # Filter key: base, dataset, and all filters influencing the result set (not the page).
+    # `fields` is a frozen dataclass, hence hashable and usable as is.
+    filters_key: _CacheKey = (
+        ODS_BASE,
+        DATASET_ID,
+        q,
+        cpv_prefix,
+        dept_codes,
+        buyer,
+        date_from,
+        date_to,
+        use_training,
+        nature_in,
+        fields,
+    )
+    cache_key: _CacheKey = (*filters_key, page, page_size, sort or "")
+    cached = _cache_get(cache_key)
+    if cached:
+        return cached
+
+    explore_kwargs: Dict[str, Any] = dict(
+        q=q,
+        cpv_prefix=cpv_prefix,
+        dept_codes=dept_codes,
+        buyer=buyer,
+        date_from=date_from,
+        date_to=date_to,
+        nature_in=nature_in,
+        sort=sort,
+        use_training=use_training,
+        page=page,
+        page_size=page_size,
+        fields=fields,
+    )
+    v1_kwargs: Dict[str, Any] = dict(
+        q=q,
+        dept_codes=dept_codes,
+        buyer=buyer,
+        use_training=use_training,
+        page=page,
+        page_size=page_size,
+        fields=fields,
+    )
+    result = _fetch_page(explore_kwargs, v1_kwargs, parallel_fallback)
+    _cache_set(cache_key, result)
+    return result
+
+
 def perform_search(
     *,
     q: str,
@@ -786,6 +1390,11 @@ def perform_search(
     # Erreurs: propage les erreurs réseau après fallback.
     """Execute search via Explore v2.1 with a fallback to Records v1.
 
+    When the schema cache is cold, the schema fetch and a speculative search
+    (using the last resolved fields) run concurrently; the speculative result
+    is kept if the fresh schema resolves to the same fields. Without previously
+    resolved fields (first search), the schema is loaded before searching.
+
     Parameters
     - q: Final composed keywords (may be empty). Already assembled from
          manual input + keyword buckets + training terms.
@@ -811,110 +1420,48 @@ def perform_search(
     - Explore `where` clause not accepted by some portals (4xx), triggering the
       fallback path. If fallback also fails, double-check fields, dataset, key.
     """
-    schema = fetch_dataset_schema(force_refresh=False)
-    fields = resolve_fields(schema)
-
-    # Cache key: include base, dataset, and all filters influencing results
-    cache_key = json.dumps(
-        {
-            "base": ODS_BASE,
-            "dataset": DATASET_ID,
-            "q": q,
-            "cpv_prefix": cpv_prefix,
-            "dept_codes": sorted(dept_codes),
-            "buyer": buyer,
-            "date_from": date_from,
-            "date_to": date_to,
-            "use_training": use_training,
-            "nature_in": nature_in or [],
-            "page": page,
-            "page_size": page_size,
-            "fields": fields.__dict__,
-            "sort": sort or "",
-        },
-        sort_keys=True,
-        ensure_ascii=False,
+    # Canonical, hashable filters: equivalent selections share one cache entry
+    search_kwargs: Dict[str, Any] = dict(
+        q=q,
+        cpv_prefix=cpv_prefix,
+        dept_codes=tuple(sorted(set(dept_codes))) if dept_codes else (),
+        buyer=buyer,
+        date_from=date_from,
+        date_to=date_to,
+        nature_in=tuple(sorted(set(nature_in))) if nature_in else None,
+        use_training=use_training,
+        page=page,
+        page_size=page_size,
+        sort=sort,
     )
-    cached = _cache_get(cache_key)
-    if cached:
-        return cached
-
-    if PREFER_EXPLORE:
-        try:
-            result = _try_explore(
-                q=q,
-                cpv_prefix=cpv_prefix,
-                dept_codes=dept_codes,
-                buyer=buyer,
-                date_from=date_from,
-                date_to=date_to,
-                nature_in=nature_in,
-                sort=sort,
-                use_training=use_training,
-                page=page,
-                page_size=page_size,
-                fields=fields,
-            )
-            _cache_set(cache_key, result)
-            return result
-        except HTTPError as he:
-            # Only fallback on client-side errors (400-499) where WHERE may be rejected
-            if 400 <= getattr(he, "code", 0) <= 499:
-                result = _try_records_v1(
-                    q=q,
-                    dept_codes=dept_codes,
-                    buyer=buyer,
-                    use_training=use_training,
-                    page=page,
-                    page_size=page_size,
-                    fields=fields,
-                )
-                _cache_set(cache_key, result)
-                return result
-            raise
-        except (URLError, json.JSONDecodeError):
-            # Network/parse error -> try v1
-            result = _try_records_v1(
-                q=q,
-                dept_codes=dept_codes,
-                buyer=buyer,
-                use_training=use_training,
-                page=page,
-                page_size=page_size,
-                fields=fields,
-            )
-            _cache_set(cache_key, result)
-            return result
-    # Prefer v1 path
-    try:
-        result = _try_records_v1(
-            q=q,
-            dept_codes=dept_codes,
-            buyer=buyer,
-            use_training=use_training,
-            page=page,
-            page_size=page_size,
-            fields=fields,
-        )
-        _cache_set(cache_key, result)
-        return result
-    except (HTTPError, URLError, json.JSONDecodeError):
-        result = _try_explore(
-            q=q,
-            cpv_prefix=cpv_prefix,
-            dept_codes=dept_codes,
-            buyer=buyer,
-            date_from=date_from,
-            date_to=date_to,
-            nature_in=nature_in,
-            sort=sort,
-            use_training=use_training,
-            page=page,
-            page_size=page_size,
-            fields=fields,
-        )
-        _cache_set(cache_key, result)
-        return result
+    if _schema_is_warm():
+        _schema, fields = schema_and_fields()
+        _LAST_FIELDS["value"] = fields
+        return _search_with_fields(fields, parallel_fallback=PARALLEL_FALLBACK, **search_kwargs)
+
+    guess: Optional[ResolvedFields] = _LAST_FIELDS.get("value")
+    if guess is None:
+        # First search of the process: no previous fields to speculate with (a
+        # default `ResolvedFields()` never equals schema-resolved ones)
+        _schema, fields = schema_and_fields()
+        _LAST_FIELDS["value"] = fields
+        return _search_with_fields(fields, parallel_fallback=PARALLEL_FALLBACK, **search_kwargs)
+
+    # Cold schema: overlap the catalog round-trip with a speculative search
+    fut_schema = _EXECUTOR.submit(schema_and_fields)
+    fut_search = _EXECUTOR.submit(_search_with_fields, guess, **search_kwargs)
+    _schema, fields = fut_schema.result()
+    _LAST_FIELDS["value"] = fields
+    if fields == guess:
+        return fut_search.result()
+    fut_search.cancel()
+    return _search_with_fields(fields, parallel_fallback=PARALLEL_FALLBACK, **search_kwargs)
+
+
+def _default_date_window() -> Tuple[str, str]:
+    # Période par défaut (ISO): 90 jours en arrière -> 365 jours en avant.
+    today = date.today()
+    return (today - timedelta(days=90)).isoformat(), (today + timedelta(days=365)).isoformat()
 
 
 def _compose_keywords(manual: str, selected_buckets: List[str], use_training: bool) -> str:
@@ -935,29 +1482,48 @@ def _compose_keywords(manual: str, selected_buckets: List[str], use_training: bo
     Likely error causes
     - None: purely deterministic string composition.
     """
-    bucket_terms: List[str] = []
-    for name in selected_buckets:
-        bucket_terms.extend(KEYWORD_BUCKETS.get(name, []))
-    bucket_expr = " OR ".join(t for t in bucket_terms if str(t).strip())
-    training_expr = " OR ".join(TRAINING_TERMS) if use_training else ""
-    manual_expr = manual or ""
-    parts = [p for p in [manual_expr, bucket_expr, training_expr] if p and p.strip()]
+    return _compose_keywords_cached(manual or "", tuple(selected_buckets), use_training)
+
+
+@functools.lru_cache(maxsize=256)
+def _compose_keywords_cached(manual: str, selected_buckets: Tuple[str, ...], use_training: bool) -> str:
+    # Même composition que `_compose_keywords`, mémorisée par combinaison de filtres.
+    bucket_expr = " OR ".join(_BUCKET_OR_EXPR[n] for n in selected_buckets if _BUCKET_OR_EXPR.get(n))
+    training_expr = _TRAINING_OR if use_training else ""
+    parts = [p for p in [manual, bucket_expr, training_expr] if p and p.strip()]
     return " OR ".join(parts)
 
 
-def _parse_csv_list(value: Optional[str]) -> List[str]:
-    # Utilité: transformer des listes CSV en liste Python en éliminant les vides.
-    """Parse a comma-separated list into a list of non-empty trimmed strings.
+def _parse_csv_list(value: Optional[str]) -> Tuple[str, ...]:
+    # Utilité: transformer des listes CSV en tuple Python en éliminant les vides.
+    """Parse a comma-separated list into a tuple of non-empty trimmed strings.
 
     Parameters
     - value: Raw string (e.g., "75,92,93") or None.
 
     Returns
-    - List of non-empty trimmed strings. Returns [] if input is None/empty.
+    - Tuple of non-empty trimmed strings. Returns () if input is None/empty.
     """
     if not value:
-        return []
-    return [s.strip() for s in value.split(",") if s.strip()]
+        return ()
+    return tuple(s for s in (p.strip() for p in value.split(",")) if s)
+
+
+def _parse_dept_codes(values: List[str]) -> Tuple[str, ...]:
+    # Utilité: lire le filtre départements (?deptCodes=75&deptCodes=92 ou "75,92").
+    """Parse department inputs into a canonical tuple of valid codes.
+
+    Parameters
+    - values: Raw `deptCodes` query values, each a single code or a CSV list.
+
+    Returns
+    - Sorted tuple of unique codes found in `_VALID_DEPTS` (unknown codes are
+      dropped). Hashable and order-independent, hence usable in cache keys as is.
+    """
+    codes = set()
+    for value in values:
+        codes.update(c.upper() for c in _parse_csv_list(value))
+    return tuple(sorted(codes & _VALID_DEPTS))
 
 
 def _normalize_record_url(base: str, dataset_id: str, raw_url: Optional[str], ref: Optional[str], record_id: Optional[str]) -> str:
@@ -983,17 +1549,19 @@ def _normalize_record_url(base: str, dataset_id: str, raw_url: Optional[str], re
     - Absolute URL as a string.
     """
     base_no_slash = base.rstrip("/")
-    host = ""
-    try:
-        host = urlparse(base_no_slash).hostname or ""
-    except Exception:
-        host = ""
+    if base_no_slash == _BASE_NO_SLASH:
+        # Cas courant: tous les appelants passent ODS_BASE -> drapeau précalculé.
+        is_boamp_portal = _IS_BOAMP_PORTAL
+    else:
+        try:
+            is_boamp_portal = (urlparse(base_no_slash).hostname or "").endswith("boamp.fr")
+        except Exception:
+            is_boamp_portal = False
     dataset_record = (
-        f"{base_no_slash}/explore/dataset/{dataset_id}/record/?id={urlencode({'id': str(record_id or '')}).split('=')[1]}"
+        f"{base_no_slash}/explore/dataset/{dataset_id}/record/?id={quote_plus(str(record_id), safe='')}"
         if record_id
         else base_no_slash
     )
-    is_boamp_portal = host.endswith("boamp.fr")
 
     if not raw_url:
         if is_boamp_portal and ref:
@@ -1001,8 +1569,12 @@ def _normalize_record_url(base: str, dataset_id: str, raw_url: Optional[str], re
         return dataset_record
 
     try:
-        # `urljoin` resolves relative URLs against the base
-        href = urljoin(base_no_slash + "/", raw_url)
+        # Les liens absolus (cas majoritaire) sont gardés tels quels: `urljoin`
+        # ne sert qu'à résoudre les URLs relatives contre la base.
+        if raw_url.startswith(("http://", "https://")):
+            href = raw_url
+        else:
+            href = urljoin(base_no_slash + "/", raw_url)
         if href == f"{base_no_slash}/" or "/pages/entreprise-accueil" in href:
             if is_boamp_portal and ref:
                 return f"{base_no_slash}/avis/detail/{ref}"
@@ -1012,6 +1584,68 @@ def _normalize_record_url(base: str, dataset_id: str, raw_url: Optional[str], re
         return (f"{base_no_slash}/avis/detail/{ref}" if is_boamp_portal and ref else dataset_record)
 
 
+def _map_records(
+    records: List[Dict[str, Any]],
+    fields: ResolvedFields,
+    buyers: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    # Utilité: convertir les enregistrements ODS (Explore ou v1) en items d'affichage/JSON.
+    # Entrées: `records` bruts, `fields` résolus. Sortie: une liste de dicts, même ordre.
+    """Map raw ODS records to the item dicts used by the templates and JSON APIs.
+
+    Parameters
+    - records: Explore v2.1 records (flat) or Records v1 records (`fields` sub-dict).
+    - fields: Resolved column names for the dataset.
+    - buyers: Optional collector filled in the same pass with distinct buyer
+      names, keyed by their casefolded form (first spelling seen wins).
+
+    Returns
+    - List of dicts with keys title, href, ref, date_iso, deadline_iso, buyer,
+      buyer_address, dept, cpv, description, budget, procedure, market_type, place.
+    """
+    base = _BASE_NO_SLASH
+    # Column names read once: the loop below uses locals instead of attribute lookups.
+    f_title, f_url, f_ref, f_date, f_deadline = fields.title, fields.url, fields.ref, fields.date, fields.deadline
+    f_buyer, f_buyer_address, f_dept, f_cpv = fields.buyer, fields.buyerAddress, fields.dept, fields.cpv
+    f_description, f_budget, f_procedure = fields.description, fields.budget, fields.procedure
+    f_market_type, f_place = fields.marketType, fields.place
+    items: List[Dict[str, Any]] = [None] * len(records)  # type: ignore[list-item]
+    for i, r in enumerate(records):
+        f = (r.get("fields") or {}) if "fields" in r else r
+        record_id = r.get("id") or r.get("recordid")
+        title = f.get(f_title)
+        if not title:
+            title = next((f[k] for k in _TITLE_KEYS_FALLBACK if f.get(k)), None) or f"Avis #{record_id}"
+        raw_url = f.get(f_url)
+        if not raw_url:
+            raw_url = next((f[k] for k in _URL_KEYS_FALLBACK if f.get(k)), None)
+        ref = f.get(f_ref) or record_id
+        date_str = f.get(f_date) or f.get("record_timestamp")
+        deadline_str = f.get(f_deadline)
+        buyer_val = f.get(f_buyer)
+        if buyers is not None and buyer_val is not None:
+            b = str(buyer_val)
+            if b:
+                buyers.setdefault(b.casefold(), b)
+        items[i] = {
+            "title": title,
+            "href": _normalize_record_url(base, DATASET_ID, raw_url, ref, record_id),
+            "ref": ref,
+            "date_iso": str(date_str)[:10] if date_str else None,
+            "deadline_iso": str(deadline_str)[:10] if deadline_str else None,
+            "buyer": buyer_val,
+            "buyer_address": f.get(f_buyer_address),
+            "dept": f.get(f_dept),
+            "cpv": f.get(f_cpv),
+            "description": f.get(f_description),
+            "budget": f.get(f_budget),
+            "procedure": f.get(f_procedure),
+            "market_type": f.get(f_market_type),
+            "place": f.get(f_place),
+        }
+    return items
+
+
 # --------------------------------------------------------------------------------------
 # Flask app and HTTP routes
 # --------------------------------------------------------------------------------------
@@ -1026,7 +1660,71 @@ app = Flask(
 # et les assets statiques (CSS) du dossier Front-end/static.
 
 
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (used when orjson is installed).
+
+    `jsonify` responses are serialized straight to UTF-8 bytes, skipping the
+    intermediate `str` and its re-encoding. Types orjson does not handle
+    natively (Decimal, objects with `__html__`...) go through Flask's
+    `DefaultJSONProvider.default`. Keys keep insertion order (no sorting).
+    """
+
+    _OPTIONS = 0 if orjson is None else orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._OPTIONS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
+
+def _cached_view(cache: _TTLCache):
+    # Utilité: mémoriser le HTML rendu d'une vue GET, clé = chemin + query string triée.
+    # Une vue peut exclure sa réponse du cache via `g.skip_view_cache = True`
+    # (erreur affichée, rafraîchissement du schéma...).
+    """Decorator caching a view's rendered HTML in `cache`.
+
+    Parameters
+    - cache: `_TTLCache` holding rendered pages; a `ttl` <= 0 disables caching.
+
+    Returns
+    - Decorator wrapping a Flask view that returns a string.
+
+    Exceptions
+    - None added; exceptions raised by the view propagate and are not cached.
+    """
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args: Any, **kwargs: Any):
+            if cache.ttl <= 0:
+                return view(*args, **kwargs)
+            key = f"{request.path}?{urlencode(sorted(request.args.items(multi=True)))}"
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            g.skip_view_cache = False
+            rv = view(*args, **kwargs)
+            if isinstance(rv, str) and not g.get("skip_view_cache"):
+                cache[key] = rv
+            return rv
+
+        return wrapper
+
+    return decorator
+
+
 @app.get("/search")
+@_cached_view(_VIEW_CACHE)
 def search_page():
     # Utilité: page SSR (optionnelle) listant les résultats côté serveur.
     """Render the advanced search page with filters and results.
@@ -1056,11 +1754,7 @@ def search_page():
     date_from: Optional[str] = request.args.get("dateFrom") or None
     date_to: Optional[str] = request.args.get("dateTo") or None
     # Departments can arrive as repeated inputs (?deptCodes=75&deptCodes=92) or comma-separated
-    dept_codes_raw: List[str] = request.args.getlist("deptCodes")
-    if dept_codes_raw:
-        dept_codes = [s.strip() for s in dept_codes_raw if s.strip()]
-    else:
-        dept_codes = _parse_csv_list(request.args.get("deptCodes"))
+    dept_codes = _parse_dept_codes(request.args.getlist("deptCodes"))
 
     # Boolean toggles (HTML checkbox returns "on" when checked)
     use_keywords = request.args.get("useKeywords") == "on"
@@ -1093,23 +1787,21 @@ def search_page():
 
     # Optional schema refresh (useful if dataset schema changes)
     if request.args.get("refreshSchema") == "1":
-        _SCHEMA_CACHE["ts"] = 0
+        g.skip_view_cache = True
         try:
             fetch_dataset_schema(force_refresh=True)
         except Exception:
             # Ignore refresh errors here; will surface during search below if any
             pass
+        # Results cached for this portal/dataset may predate the schema change
+        _cache_invalidate((ODS_BASE, DATASET_ID))
+        _VIEW_CACHE.clear()
 
     # Compléter une période par défaut si activée mais sans dates fournies
     if use_date and (not date_from or not date_to):
-        try:
-            from datetime import date, timedelta
-            if not date_from:
-                date_from = (date.today() - timedelta(days=90)).isoformat()
-            if not date_to:
-                date_to = (date.today() + timedelta(days=365)).isoformat()
-        except Exception:
-            pass
+        default_from, default_to = _default_date_window()
+        date_from = date_from or default_from
+        date_to = date_to or default_to
 
     # Compose final text query: only include parts if toggled on
     final_q = _compose_keywords(
@@ -1120,7 +1812,7 @@ def search_page():
 
     # Build filters according to toggles
     effective_cpv_prefix = cpv_prefix if use_cpv and cpv_prefix.strip() else ""
-    effective_dept_codes = dept_codes if use_dept else []
+    effective_dept_codes = dept_codes if use_dept else ()
     effective_buyer = (buyer if (use_buyer and buyer and buyer.strip()) else None)
     effective_date_from = date_from if use_date and date_from else None
     effective_date_to = date_to if use_date and date_to else None
@@ -1139,86 +1831,32 @@ def search_page():
             buyer=effective_buyer,
             date_from=effective_date_from,
             date_to=effective_date_to,
+            nature_in=None,
             use_training=use_training,
             page=page,
             page_size=page_size,
         )
     except Exception as e:  # noqa: BLE001 — intentionally broad to show message in UI
         error = str(e)
+        g.skip_view_cache = True  # do not serve a transient error to other clients
 
-    # Compute available buyers list from currently loaded records for the select control
-    buyers: List[str] = []
-    try:
-        seen = set()
-        for r in records:
-            f = (r.get("fields") or {}) if "fields" in r else r
-            b = f.get(fields.buyer)
-            if b is None:
-                continue
-            s = str(b)
-            if s and s not in seen:
-                seen.add(s)
-                buyers.append(s)
-        buyers.sort(key=lambda s: s.lower())
-    except Exception:
-        buyers = []
-
-    # Prepare mapped records for template convenience
-    base = ODS_BASE.rstrip("/")
-    mapped: List[Dict[str, Any]] = []
-    for r in records:
-        f = (r.get("fields") or {}) if "fields" in r else r
-        title = f.get(fields.title) or f.get("objet") or f.get("titre") or f"Avis #{r.get('id') or r.get('recordid')}"
-        raw_url = (
-            f.get(fields.url)
-            or f.get("permalink")
-            or f.get("url_avis")
-            or f.get("pageurl")
-            or f.get("lien")
-            or f.get("link")
-            or f.get("url")
-            or f.get("permalien")
-        )
-        ref = f.get(fields.ref) or r.get("id") or r.get("recordid")
-        href = _normalize_record_url(base, DATASET_ID, raw_url, ref, r.get("id") or r.get("recordid"))
-        date_str = f.get(fields.date) or f.get("record_timestamp")
-        date_iso = str(date_str)[:10] if date_str else None
-        deadline_str = f.get(fields.deadline)
-        deadline_iso = (str(deadline_str)[:10] if deadline_str else None)
-        buyer_val = f.get(fields.buyer)
-        buyer_address = f.get(fields.buyerAddress)
-        dept_val = f.get(fields.dept)
-        cpv_val = f.get(fields.cpv)
-        description = f.get(fields.description)
-        budget_val = f.get(fields.budget)
-        procedure_val = f.get(fields.procedure)
-        market_type_val = f.get(fields.marketType)
-        place_val = f.get(fields.place)
-
-        mapped.append(
-            {
-                "title": title,
-                "href": href,
-                "ref": ref,
-                "date_iso": date_iso,
-                "deadline_iso": deadline_iso,
-                "buyer": buyer_val,
-                "buyer_address": buyer_address,
-                "dept": dept_val,
-                "cpv": cpv_val,
-                "description": description,
-                "budget": budget_val,
-                "procedure": procedure_val,
-                "market_type": market_type_val,
-                "place": place_val,
-            }
-        )
+    # Prepare mapped records for template convenience; the same pass collects the
+    # distinct buyers offered in the select control
+    buyers_by_key: Dict[str, str] = {}
+    mapped = _map_records(records, fields, buyers=buyers_by_key)
+    buyers: List[str] = sorted(buyers_by_key.values(), key=str.casefold)
 
     # Total pages (if total is known)
     total_pages: int = 1
     if isinstance(total, int) and page_size > 0:
         total_pages = max(1, (total + page_size - 1) // page_size)
 
+    # Pagination links preserving current filters (only `page` changes); url_for keeps
+    # `request.script_root`, so links stay valid when the app is mounted under a prefix
+    other_args = {k: v for k, v in request.args.to_dict(flat=False).items() if k != "page"}
+    prev_url = url_for("search_page", **other_args, page=max(1, page - 1))
+    next_url = url_for("search_page", **other_args, page=min(total_pages, page + 1))
+
     return render_template(
         "index.html",
         # Data for results and pagination
@@ -1227,6 +1865,8 @@ def search_page():
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        prev_url=prev_url,
+        next_url=next_url,
         # Filters current state
         keywords=keywords,
         cpv_prefix=cpv_prefix,
@@ -1279,17 +1919,27 @@ def cpv_page():
     return render_template("cpv.html", cpvs=CPV_CATALOG, ods_base=ODS_BASE, dataset_id=DATASET_ID)
 
 
-def _export_rows_from_json_items(items: List[Dict[str, Any]]) -> List[List[str]]:
-    # Utilité: centraliser la construction des lignes pour CSV/Excel.
-    rows: List[List[str]] = [["Intitule", "Lien", "Date_limite", "Nom_Adresse_Acheteur"]]
-    for it in items:
-        rows.append([
-            str(it.get("title", "")),
-            str(it.get("href", "")),
-            str(it.get("deadline_iso", "")),
-            str(it.get("buyer_address") or it.get("buyer") or ""),
-        ])
-    return rows
+# UTF-8 BOM (Excel) + header row, encoded once.
+_CSV_HEADER: bytes = "\ufeffIntitule;Lien;Date_limite;Nom_Adresse_Acheteur\r\n".encode("utf-8")
+
+
+def _csv_field(value: Any) -> str:
+    # Même règle que csv.writer (QUOTE_MINIMAL, délimiteur ';'): guillemets seulement si nécessaire.
+    s = str(value)
+    if ";" in s or '"' in s or "\n" in s or "\r" in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+
+def _export_csv_bytes(items: List[Dict[str, Any]]) -> bytes:
+    # Utilité: centraliser la construction du CSV (séparateur ';', BOM UTF-8) pour CSV/Excel.
+    lines = [
+        f"{_csv_field(it.get('title', ''))};{_csv_field(it.get('href', ''))};"
+        f"{_csv_field(it.get('deadline_iso', ''))};"
+        f"{_csv_field(it.get('buyer_address') or it.get('buyer') or '')}\r\n"
+        for it in items
+    ]
+    return _CSV_HEADER + "".join(lines).encode("utf-8")
 
 
 @app.post("/export/csv")
@@ -1302,15 +1952,8 @@ def export_csv():
     """
     try:
         data = request.get_json(force=True, silent=False) or {}
-        items = list(data.get("items") or [])
-        rows = _export_rows_from_json_items(items)
         # Build CSV with semicolons and UTF-8 BOM for Excel
-        import io, csv
-        buf = io.StringIO()
-        writer = csv.writer(buf, delimiter=';')
-        for r in rows:
-            writer.writerow(r)
-        csv_bytes = ('\ufeff' + buf.getvalue()).encode('utf-8')
+        csv_bytes = _export_csv_bytes(data.get("items") or [])
         return Response(csv_bytes, mimetype='text/csv', headers={'Content-Disposition': 'attachment; filename="avis_selection.csv"'})
     except Exception as e:  # noqa: BLE001
         return jsonify({"error": str(e)}), 400
@@ -1322,19 +1965,24 @@ def export_excel_csv():
     """Export to an Excel-compatible CSV (same content, different mimetype/filename)."""
     try:
         data = request.get_json(force=True, silent=False) or {}
-        items = list(data.get("items") or [])
-        rows = _export_rows_from_json_items(items)
-        import io, csv
-        buf = io.StringIO()
-        writer = csv.writer(buf, delimiter=';')
-        for r in rows:
-            writer.writerow(r)
-        csv_bytes = ('\ufeff' + buf.getvalue()).encode('utf-8')
+        csv_bytes = _export_csv_bytes(data.get("items") or [])
         return Response(csv_bytes, mimetype='application/vnd.ms-excel', headers={'Content-Disposition': 'attachment; filename="avis_selection.xls"'})
     except Exception as e:  # noqa: BLE001
         return jsonify({"error": str(e)}), 400
 
 
+# Static VCALENDAR envelope, encoded once (RFC 5545: every line ends with CRLF).
+_ICS_HEAD: bytes = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//BOAMP Minimal//FR\r\n"
+_ICS_FOOT: bytes = b"END:VCALENDAR\r\n"
+# RFC 5545 TEXT escaping in one C-level pass (backslash, ';', ',', line breaks).
+_ICS_TEXT_TRANS = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": ""})
+
+
+def _ics_escape(value: str) -> str:
+    # Échappe une valeur TEXT (SUMMARY/DESCRIPTION) d'un évènement ICS.
+    return value.translate(_ICS_TEXT_TRANS)
+
+
 @app.post("/export/ics")
 def export_ics():
     # Utilité: générer un calendrier ICS d'échéances (deadlines) sélectionnées.
@@ -1345,46 +1993,38 @@ def export_ics():
     try:
         data = request.get_json(force=True, silent=False) or {}
         items = list(data.get("items") or [])
-        from datetime import datetime
+
         def ics_datetime(d: Optional[str]) -> Optional[str]:
             if not d:
                 return None
+            s = str(d)
+            # Fast path: plain YYYY-MM-DD (all-day event), no strptime needed
+            if len(s) == 10 and s[4] == "-" and s[7] == "-" and s[:4].isdigit() and s[5:7].isdigit() and s[8:].isdigit():
+                return s[:4] + s[5:7] + s[8:]
             try:
-                # Assume YYYY-MM-DD (all-day event)
-                dt = datetime.strptime(d, "%Y-%m-%d")
-                return dt.strftime("%Y%m%d")
+                dt = datetime.fromisoformat(s)
+                return dt.strftime("%Y%m%dT%H%M%SZ")
             except Exception:
-                try:
-                    dt = datetime.fromisoformat(d)
-                    return dt.strftime("%Y%m%dT%H%M%SZ")
-                except Exception:
-                    return None
-
-        lines = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            "PRODID:-//BOAMP Minimal//FR",
-        ]
+                return None
+
+        out = bytearray(_ICS_HEAD)
         for it in items:
-            title = str(it.get("title", "Avis BOAMP"))
+            title = _ics_escape(str(it.get("title", "Avis BOAMP")))
             url = str(it.get("href", ""))
             deadline = ics_datetime(it.get("deadline_iso") or it.get("date_iso"))
-            buyer_addr = str(it.get("buyer_address") or "")
-            desc = buyer_addr.replace("\n", " ")
-            lines.append("BEGIN:VEVENT")
-            lines.append(f"SUMMARY:{title}")
+            desc = _ics_escape(str(it.get("buyer_address") or ""))
+            event = f"BEGIN:VEVENT\r\nSUMMARY:{title}\r\n"
             if deadline and len(deadline) == 8:
-                lines.append(f"DTSTART;VALUE=DATE:{deadline}")
-                lines.append(f"DTEND;VALUE=DATE:{deadline}")
+                event += f"DTSTART;VALUE=DATE:{deadline}\r\nDTEND;VALUE=DATE:{deadline}\r\n"
             elif deadline:
-                lines.append(f"DTSTART:{deadline}")
+                event += f"DTSTART:{deadline}\r\n"
             if url:
-                lines.append(f"URL:{url}")
+                event += f"URL:{url}\r\n"
             if desc:
-                lines.append(f"DESCRIPTION:{desc}")
-            lines.append("END:VEVENT")
-        lines.append("END:VCALENDAR")
-        content = "\r\n".join(lines).encode('utf-8')
+                event += f"DESCRIPTION:{desc}\r\n"
+            out += (event + "END:VEVENT\r\n").encode("utf-8")
+        out += _ICS_FOOT
+        content = bytes(out)
         return Response(content, mimetype='text/calendar', headers={'Content-Disposition': 'attachment; filename="avis_selection.ics"'})
     except Exception as e:  # noqa: BLE001
         return jsonify({"error": str(e)}), 400
@@ -1394,6 +2034,8 @@ def export_ics():
 def api_explore_demo():
     """Call the exact Explore v2.1 endpoint shown in the official docs.
 
+    On a cold schema cache, the records call and the schema fetch overlap.
+
     Query params
     - limit: optional, default 20
 
@@ -1406,79 +2048,44 @@ def api_explore_demo():
         except ValueError:
             limit = 20
 
-        # Resolve fields to map records consistently
-        schema = fetch_dataset_schema(force_refresh=False)
-        fields = resolve_fields(schema)
-
         base = ODS_BASE.rstrip("/")
         params = [("limit", str(limit))]
         if ODS_APIKEY:
             params.append(("apikey", ODS_APIKEY))
         debug_url = f"{base}/api/explore/v2.1/catalog/datasets/{DATASET_ID}/records?{urlencode(params)}"
 
-        data = _http_get_json(debug_url)
-        results = list(data.get("results") or [])
+        # The records URL does not depend on the schema: fetch both concurrently
+        if _schema_is_warm():
+            data = _http_get_json(debug_url)
+        else:
+            fut_data = _EXECUTOR.submit(_http_get_json, debug_url)
+            schema_and_fields()
+            data = fut_data.result()
+        # Resolve fields to map records consistently
+        _schema, fields = schema_and_fields()
+        results = data.get("results") or []
         total = data.get("total_count")
 
-        items = []
-        for r in results:
-            f = (r.get("fields") or {}) if "fields" in r else r
-            title = (
-                f.get(fields.title)
-                or f.get("objet")
-                or f.get("titre")
-                or f.get("title")
-                or f"Avis #{r.get('id') or r.get('recordid')}"
-            )
-            raw_url = (
-                f.get(fields.url)
-                or f.get("permalink")
-                or f.get("url_avis")
-                or f.get("pageurl")
-                or f.get("lien")
-                or f.get("link")
-                or f.get("url")
-                or f.get("permalien")
-            )
-            ref = f.get(fields.ref) or r.get("id") or r.get("recordid")
-            href = _normalize_record_url(base, DATASET_ID, raw_url, ref, r.get("id") or r.get("recordid"))
-            date_str = f.get(fields.date) or f.get("record_timestamp")
-            date_iso = str(date_str)[:10] if date_str else None
-            deadline_str = f.get(fields.deadline)
-            deadline_iso = (str(deadline_str)[:10] if deadline_str else None)
-            buyer_address = f.get(fields.buyerAddress)
-            items.append(
-                {
-                    "title": title,
-                    "href": href,
-                    "ref": ref,
-                    "date_iso": date_iso,
-                    "buyer": f.get(fields.buyer),
-                    "dept": f.get(fields.dept),
-                    "cpv": f.get(fields.cpv),
-                    "description": f.get(fields.description),
-                    "deadline_iso": deadline_iso,
-                    "buyer_address": buyer_address,
-                    "budget": f.get(fields.budget),
-                    "procedure": f.get(fields.procedure),
-                    "market_type": f.get(fields.marketType),
-                    "place": f.get(fields.place),
-                }
-            )
+        items = _map_records(results, fields)
 
         return jsonify({"items": items, "total": total, "debug_url": debug_url})
     except Exception as e:  # noqa: BLE001
         return jsonify({"items": [], "total": None, "error": str(e)}), 200
 
 
+# Query string values read as True by `_get_bool` (compared lower-cased).
+_BOOL_TRUE: FrozenSet[str] = frozenset({"on", "true", "1", "yes"})
+
+
 def _get_bool(arg_value: Optional[str]) -> bool:
     """Interpret a query string boolean value.
 
-    Accepts 'on', 'true', '1' as True (case-insensitive); otherwise False.
+    Accepts 'on', 'true', '1', 'yes' as True (case-insensitive); otherwise False.
     """
     if not arg_value:
         return False
-    return arg_value.lower() in {"on", "true", "1", "yes"}
+    # "on" (HTML checkbox) is the common case: skip the lower() copy
+    return arg_value == "on" or arg_value.lower() in _BOOL_TRUE
 
 
 @app.get("/api/search")
@@ -1490,7 +2097,8 @@ def api_search():
       dateFrom, dateTo, useTraining, page, pageSize
 
     Returns (JSON)
-    - { items: [ {title, href, ref, date_iso, buyer, dept, cpv, description} ],
+    - { items: [ {title, href, ref, date_iso, deadline_iso, buyer, buyer_address,
+        dept, cpv, description, budget, procedure, market_type, place} ],
         total: number|null, debug_url: string }
     """
     q = request.args.get("q", "")
@@ -1498,11 +2106,7 @@ def api_search():
     buyer = request.args.get("buyer") or None
     date_from = request.args.get("dateFrom") or None
     date_to = request.args.get("dateTo") or None
-    dept_codes_raw = request.args.getlist("deptCodes")
-    if dept_codes_raw:
-        dept_codes = [s.strip() for s in dept_codes_raw if s.strip()]
-    else:
-        dept_codes = _parse_csv_list(request.args.get("deptCodes"))
+    dept_codes = _parse_dept_codes(request.args.getlist("deptCodes"))
 
     # Defaults: last 90 days to today+365, page=1, size=20
     try:
@@ -1525,19 +2129,10 @@ def api_search():
 
     # If date filtering is enabled (or dates explicitly provided), ensure bounds
     if (use_date_flag or date_from or date_to):
-        if not date_from:
-            # last 90 days
-            try:
-                from datetime import date, timedelta
-                date_from = (date.today() - timedelta(days=90)).isoformat()
-            except Exception:
-                date_from = None
-        if not date_to:
-            try:
-                from datetime import date, timedelta
-                date_to = (date.today() + timedelta(days=365)).isoformat()
-            except Exception:
-                date_to = None
+        # Missing bounds: last 90 days -> today + 365 days
+        default_from, default_to = _default_date_window()
+        date_from = date_from or default_from
+        date_to = date_to or default_to
     else:
         date_from = None
         date_to = None
@@ -1557,67 +2152,68 @@ def api_search():
             sort=sort,
         )
 
-        base = ODS_BASE.rstrip("/")
-        items: List[Dict[str, Any]] = []
-        for r in records:
-            f = (r.get("fields") or {}) if "fields" in r else r
-            title = (
-                f.get(fields.title)
-                or f.get("objet")
-                or f.get("titre")
-                or f.get("title")
-                or f"Avis #{r.get('id') or r.get('recordid')}"
-            )
-            raw_url = (
-                f.get(fields.url)
-                or f.get("permalink")
-                or f.get("url_avis")
-                or f.get("pageurl")
-                or f.get("lien")
-                or f.get("link")
-                or f.get("url")
-                or f.get("permalien")
-            )
-            ref = f.get(fields.ref) or r.get("id") or r.get("recordid")
-            href = _normalize_record_url(base, DATASET_ID, raw_url, ref, r.get("id") or r.get("recordid"))
-            date_str = f.get(fields.date) or f.get("record_timestamp")
-            date_iso = str(date_str)[:10] if date_str else None
-            deadline_str = f.get(fields.deadline)
-            deadline_iso = (str(deadline_str)[:10] if deadline_str else None)
-            buyer_address = f.get(fields.buyerAddress)
-            items.append(
-                {
-                    "title": title,
-                    "href": href,
-                    "ref": ref,
-                    "date_iso": date_iso,
-                    "buyer": f.get(fields.buyer),
-                    "dept": f.get(fields.dept),
-                    "cpv": f.get(fields.cpv),
-                    "description": f.get(fields.description),
-                    "deadline_iso": deadline_iso,
-                    "buyer_address": buyer_address,
-                }
-            )
+        items = _map_records(records, fields)
         return jsonify({"items": items, "total": total, "debug_url": debug_url})
     except Exception as e:  # noqa: BLE001
         # Return JSON with error information but avoid hard 500 to keep UI functional
         return jsonify({"items": [], "total": None, "error": str(e)}), 200
 
 
+def warm_up_caches() -> None:
+    # Utilité: précharger schéma + champs résolus et ouvrir une connexion keep-alive
+    # vers ODS_BASE avant la première requête utilisateur.
+    """Pre-load the schema cache and the HTTP connection pool.
+
+    The schema lives on `ODS_BASE`, so fetching it also leaves an established
+    TLS connection in the pool for the first search.
+
+    Exceptions
+    - None. Failures are logged; the first request will simply retry.
+    """
+    try:
+        schema_and_fields()
+    except Exception as e:  # noqa: BLE001 — warm-up is best effort
+        _LOG.warning("Cache warm-up failed: %s", e)
+
+
+_WARMUP_LOCK = threading.Lock()
+_WARMUP_STARTED: Dict[str, bool] = {"value": False}
+
+
+def _start_warm_up() -> None:
+    # Lance `warm_up_caches` une seule fois par process, dans un thread démon.
+    if not WARMUP_ON_START:
+        return
+    with _WARMUP_LOCK:
+        if _WARMUP_STARTED["value"]:
+            return
+        _WARMUP_STARTED["value"] = True
+    threading.Thread(target=warm_up_caches, name="ods-warmup", daemon=True).start()
+
+
 def create_app() -> Flask:
     """Factory for WSGI servers.
 
+    Also starts the background cache warm-up (see `WARMUP_ON_START`). Servers
+    importing `app` directly can call `warm_up_caches()` from a per-worker hook
+    (e.g. gunicorn `post_worker_init`) so each worker warms its own pool.
+
     Returns
     - Configured Flask application instance.
 
     Exceptions
     - None.
     """
+    _start_warm_up()
     return app
 
 
 if __name__ == "__main__":
     # Development entrypoint. In production, use a WSGI server (gunicorn/uwsgi)
     # and `create_app()`.
-    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", "8000")), debug=True)
+    debug = True
+    # With the reloader, this block also runs in the watcher (parent) process, which
+    # never serves requests: only warm up the serving child (WERKZEUG_RUN_MAIN).
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        _start_warm_up()
+    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", "8000")), debug=debug)